@@ -30,7 +30,7 @@ from datetime import datetime, timezone
 
 import pandas as pd
 
-from core.backtest_engine import run_backtest
+from core.backtest_engine import fetch_many_ticker_data, run_backtest
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "screener.db")
 
@@ -155,12 +155,18 @@ def main():
         f"cash ${args.cash:,.0f}\n"
     )
 
+    # One batched download for the whole universe; tickers it misses fall
+    # back to run_backtest's own per-ticker fetch.
+    price_cache = fetch_many_ticker_data(by_ticker)
+
     rows = []
     for ticker in tickers:
         signals = by_ticker[ticker]
+        data    = price_cache.get(ticker)
         result  = run_backtest(
             ticker,
             signals,
+            data=data if data is not None and not data.empty else None,
             cash=args.cash,
             commission=args.commission,
             max_hold_days=args.max_hold_days,
@@ -180,7 +186,8 @@ def main():
                 f"wr {result['win_rate']:4.0f}%  "
                 f"dd {result['max_drawdown']:5.1f}%"
             )
-        time.sleep(0.1)   # avoid yfinance rate-limiting
+        if data is None or data.empty:
+            time.sleep(0.1)   # per-ticker fallback fetch — avoid yfinance rate-limiting
 
     # ── Portfolio summary ────────────────────────────────────────────────────
     valid = [r for r in rows if not r["error"] and r["n_trades"] > 0]
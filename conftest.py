@@ -1,2 +1,10 @@
 # Root conftest.py — ensures the repo root is on sys.path so tests can import
 # run, options_backtest, and providers without a package install step.
+
+import os
+import tempfile
+
+# Keep test runs out of the developer's real bar store (providers/cached_provider.py).
+os.environ.setdefault(
+    "TRADESTRATEGY_BAR_STORE", os.path.join(tempfile.mkdtemp(prefix="ts-tests-"), "bars.db")
+)
@@ -20,9 +20,11 @@ import math
 import pandas as pd
 from backtesting import Backtest, Strategy
 
+from providers.cached_provider import CachedMarketDataProvider
 from providers.yfinance_provider import YFinanceProvider
 
-_provider = YFinanceProvider()
+# Backtest ranges are historical — a warm bar store serves them without a fetch.
+_provider = CachedMarketDataProvider(YFinanceProvider())
 
 
 # ---------------------------------------------------------------------------
@@ -74,13 +76,15 @@ class ScreenerStrategy(Strategy):
 # Data helper
 # ---------------------------------------------------------------------------
 
-def _fetch_data(ticker: str, signals: list[dict]) -> pd.DataFrame:
-    """Fetch daily OHLCV covering all signal dates plus a forward buffer."""
+def _signal_window(signals: list[dict]) -> tuple[str, str]:
+    """[start, end) fetch window covering all signal dates plus a forward buffer."""
     dates = sorted(s["date"] for s in signals)
     start = (pd.Timestamp(dates[0])  - pd.Timedelta(days=10)).strftime("%Y-%m-%d")
     end   = (pd.Timestamp(dates[-1]) + pd.Timedelta(days=30)).strftime("%Y-%m-%d")
+    return start, end
+
 
-    data = _provider.get_ohlcv_range(ticker, start=start, end=end)
+def _normalise(data: pd.DataFrame) -> pd.DataFrame:
     if data.empty:
         return data
 
@@ -91,11 +95,44 @@ def _fetch_data(ticker: str, signals: list[dict]) -> pd.DataFrame:
     return data[["Open", "High", "Low", "Close", "Volume"]]
 
 
+def _fetch_data(ticker: str, signals: list[dict]) -> pd.DataFrame:
+    """Fetch daily OHLCV covering all signal dates plus a forward buffer."""
+    start, end = _signal_window(signals)
+    return _normalise(_provider.get_ohlcv_range(ticker, start=start, end=end))
+
+
 def fetch_ticker_data(ticker: str, signals: list[dict]) -> pd.DataFrame:
     """Public wrapper around _fetch_data for use by research sweep pre-caching."""
     return _fetch_data(ticker, signals)
 
 
+def fetch_many_ticker_data(signal_groups: dict[str, list[dict]]) -> dict[str, pd.DataFrame]:
+    """Batched _fetch_data for {ticker: signals}.
+
+    One bulk download spans the union of every ticker's window; each frame is
+    then trimmed back to that ticker's own window so results match the
+    single-ticker path. Failed tickers map to an empty DataFrame.
+    """
+    windows = {t: _signal_window(sigs) for t, sigs in signal_groups.items() if sigs}
+    if not windows:
+        return {t: pd.DataFrame() for t in signal_groups}
+
+    start = min(w[0] for w in windows.values())
+    end   = max(w[1] for w in windows.values())
+    bulk  = _provider.get_ohlcv_many(list(windows), start=start, end=end)
+
+    out: dict[str, pd.DataFrame] = {}
+    for ticker in signal_groups:
+        data = bulk.get(ticker, pd.DataFrame())
+        if ticker not in windows or data.empty:
+            out[ticker] = pd.DataFrame()
+            continue
+        data = _normalise(data)
+        w_start, w_end = windows[ticker]
+        out[ticker] = data[(data.index >= w_start) & (data.index < w_end)]
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Public interface
 # ---------------------------------------------------------------------------
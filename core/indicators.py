@@ -0,0 +1,287 @@
+"""
+core/indicators.py — Cross-sectional indicator engine for the daily screener.
+
+Computes every indicator `run.screen_ticker` needs — EMA9/20/200, RSI(14),
+ATR(14), MACD(12/26/9), cumulative VWAP, 3-bar volume trend, 20-session
+high, dollar volume and 10-bar volume CV — for a whole universe at once.
+
+Layout: each ticker's bars are compacted (rows without a close dropped, as
+`get_ohlcv_many` already does) and tickers with the same bar count are
+stacked into one (tickers × bars) C-contiguous array. Recursive indicators
+then step once over the bar axis with NumPy ops across all tickers, and
+reductions run along the contiguous last axis.
+
+The results are bit-for-bit identical to the per-ticker pandas code in
+run.py, not merely close:
+  - `_ewm_mean` replays pandas' adjust=False EWM update, including its
+    (old_wt·w + new_wt·x) / (old_wt + new_wt) normalisation and the skip
+    when the value is unchanged.
+  - `_rolling_mean` replays pandas' online rolling mean: Kahan-compensated
+    add/remove sums, the constant-window shortcut and the sign clamps.
+  - Full-window sums/means/stds reduce each row along its contiguous axis,
+    which is the same pairwise summation NumPy applies to a 1-D Series.
+    Grouping by bar count keeps the summation tree identical to the
+    per-ticker slice (padding would change it).
+
+Public API:
+    compute_indicators(panel) -> DataFrame indexed by ticker
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+INDICATOR_COLUMNS = [
+    "n_bars", "price", "prev_close", "change_pct", "rvol",
+    "ema9", "ema20", "ema200", "rsi", "atr",
+    "macd", "macd_signal", "vwap", "volume_trend_up",
+    "high_20d", "dollar_volume", "vol_cv",
+]
+
+
+# ---------------------------------------------------------------------------
+# Panel normalisation
+# ---------------------------------------------------------------------------
+
+def _to_frames(panel) -> dict[str, pd.DataFrame]:
+    """Accept {ticker: OHLCV DataFrame} or a (date × (field, ticker)) panel
+    with MultiIndex columns in either level order."""
+    if isinstance(panel, dict):
+        return panel
+    cols = panel.columns
+    if not isinstance(cols, pd.MultiIndex):
+        raise ValueError("panel must be a dict of frames or have MultiIndex (field, ticker) columns")
+    field_level = 0 if set(cols.get_level_values(0)) & set(_FIELDS) else 1
+    tickers = cols.get_level_values(1 - field_level).unique()
+    return {
+        t: panel.xs(t, axis=1, level=1 - field_level)
+        for t in tickers
+    }
+
+
+def _compact(df: pd.DataFrame) -> dict[str, np.ndarray] | None:
+    if df is None or df.empty or not set(_FIELDS).issubset(df.columns):
+        return None
+    df = df.dropna(subset=["Close"])
+    if len(df) < 2:
+        return None
+    return {f: df[f].to_numpy(dtype=np.float64) for f in _FIELDS}
+
+
+# ---------------------------------------------------------------------------
+# pandas-exact kernels over (tickers × bars) arrays
+# ---------------------------------------------------------------------------
+
+def _ewm_mean(x: np.ndarray, span: int) -> np.ndarray:
+    """Series.ewm(span=span, adjust=False).mean() row-wise (no NaNs)."""
+    com   = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt, new_wt = 1.0 - alpha, alpha
+    denom = old_wt + new_wt
+    out = np.empty_like(x)
+    w = x[:, 0].copy()
+    out[:, 0] = w
+    for i in range(1, x.shape[1]):
+        cur = x[:, i]
+        w = np.where(w != cur, (old_wt * w + new_wt * cur) / denom, w)
+        out[:, i] = w
+    return out
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Series.rolling(window).mean() row-wise, NaN-aware (min_periods=window)."""
+    n_rows, n = x.shape
+    out = np.full_like(x, np.nan)
+
+    nobs     = np.zeros(n_rows, dtype=np.int64)
+    neg_ct   = np.zeros(n_rows, dtype=np.int64)
+    same_ct  = np.zeros(n_rows, dtype=np.int64)
+    sum_x    = np.zeros(n_rows)
+    comp_add = np.zeros(n_rows)
+    comp_rem = np.zeros(n_rows)
+    prev     = x[:, 0].copy()
+
+    for i in range(n):
+        # remove the value leaving the window
+        if i >= window:
+            val = x[:, i - window]
+            ok  = ~np.isnan(val)
+            y   = -val - comp_rem
+            t   = sum_x + y
+            comp_rem = np.where(ok, t - sum_x - y, comp_rem)
+            sum_x    = np.where(ok, t, sum_x)
+            nobs    -= ok
+            neg_ct  -= ok & np.signbit(val)
+
+        # add the value entering the window
+        val = x[:, i]
+        ok  = ~np.isnan(val)
+        y   = val - comp_add
+        t   = sum_x + y
+        comp_add = np.where(ok, t - sum_x - y, comp_add)
+        sum_x    = np.where(ok, t, sum_x)
+        nobs    += ok
+        neg_ct  += ok & np.signbit(val)
+        same_ct  = np.where(ok, np.where(val == prev, same_ct + 1, 1), same_ct)
+        prev     = np.where(ok, val, prev)
+
+        valid = (nobs >= window) & (nobs > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            res = sum_x / nobs
+        res = np.where(same_ct >= nobs, prev, res)
+        res = np.where((same_ct < nobs) & (neg_ct == 0) & (res < 0), 0.0, res)
+        res = np.where((same_ct < nobs) & (neg_ct == nobs) & (res > 0), 0.0, res)
+        out[:, i] = np.where(valid, res, np.nan)
+    return out
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    out = np.empty_like(x)
+    out[:, 0] = np.nan
+    out[:, 1:] = x[:, 1:] - x[:, :-1]
+    return out
+
+
+def _shift(x: np.ndarray) -> np.ndarray:
+    out = np.empty_like(x)
+    out[:, 0] = np.nan
+    out[:, 1:] = x[:, :-1]
+    return out
+
+
+def _clip_lower0(x: np.ndarray) -> np.ndarray:
+    """Series.clip(lower=0): values >= 0 (and NaN) kept as-is, others → 0."""
+    return np.where((x >= 0) | np.isnan(x), x, 0.0)
+
+
+def _clip_upper0(x: np.ndarray) -> np.ndarray:
+    """Series.clip(upper=0): values <= 0 (and NaN) kept as-is, others → 0."""
+    return np.where((x <= 0) | np.isnan(x), x, 0.0)
+
+
+def _mean(x: np.ndarray) -> np.ndarray:
+    return x.sum(axis=1) / x.shape[1]
+
+
+def _std(x: np.ndarray) -> np.ndarray:
+    """Sample std (ddof=1), same two-pass formula as pandas' nanvar."""
+    avg = x.sum(axis=1) / x.shape[1]
+    sqr = (avg[:, None] - x) ** 2
+    return np.sqrt(sqr.sum(axis=1) / (x.shape[1] - 1))
+
+
+# ---------------------------------------------------------------------------
+# One bar-count group
+# ---------------------------------------------------------------------------
+
+def _group_indicators(o, h, l, c, v) -> dict[str, np.ndarray]:
+    n_rows, n = c.shape
+    price = c[:, -1]
+    prev  = c[:, -2]
+
+    # RSI(14) — NaN → neutral 50
+    delta = _diff(c)
+    gain  = _rolling_mean(_clip_lower0(delta), 14)[:, -1]
+    loss  = _rolling_mean(-_clip_upper0(delta), 14)[:, -1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rs  = gain / np.where(loss == 0, np.nan, loss)
+        rsi = 100 - 100 / (1 + rs)
+    rsi = np.where(np.isnan(rsi), 50.0, rsi)
+
+    # ATR(14) — NaN → 0.01
+    pc  = _shift(c)
+    tr  = np.fmax(np.fmax(h - l, np.abs(h - pc)), np.abs(l - pc))
+    atr = _rolling_mean(tr, 14)[:, -1]
+    atr = np.where(np.isnan(atr), 0.01, atr)
+
+    # MACD(12/26/9)
+    line   = _ewm_mean(c, 12) - _ewm_mean(c, 26)
+    signal = _ewm_mean(line, 9)[:, -1]
+
+    # Cumulative VWAP over the whole window
+    typical = (h + l + c) / 3
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vwap = np.cumsum(typical * v, axis=1)[:, -1] / np.cumsum(v, axis=1)[:, -1]
+    vwap = np.where(v.sum(axis=1) > 0, vwap, typical[:, -1])
+
+    # 3-bar volume trend (needs 7 bars)
+    if n >= 7:
+        vol3 = _rolling_mean(v, 3)
+        trend_up = (vol3[:, -1] > vol3[:, -4]).astype(np.int64)
+    else:
+        trend_up = np.zeros(n_rows, dtype=np.int64)
+
+    # 10 bars before the last — volume coefficient of variation
+    if n >= 11:
+        win    = np.ascontiguousarray(v[:, -11:-1])
+        w_mean = _mean(win)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cv = _std(win) / w_mean
+        vol_cv = np.where(w_mean > 0, cv, np.nan)
+    else:
+        vol_cv = np.full(n_rows, np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rvol = v[:, -1] / _mean(np.ascontiguousarray(v[:, :-1]))
+
+    return {
+        "n_bars":          np.full(n_rows, n, dtype=np.int64),
+        "price":           price,
+        "prev_close":      prev,
+        "change_pct":      (price / prev - 1) * 100,
+        "rvol":            rvol,
+        "ema9":            _ewm_mean(c, 9)[:, -1],
+        "ema20":           _ewm_mean(c, 20)[:, -1],
+        "ema200":          _ewm_mean(c, 200)[:, -1],
+        "rsi":             rsi,
+        "atr":             atr,
+        "macd":            line[:, -1],
+        "macd_signal":     signal,
+        "vwap":            vwap,
+        "volume_trend_up": trend_up,
+        "high_20d":        c[:, -20:].max(axis=1) if n >= 20 else np.full(n_rows, np.nan),
+        "dollar_volume":   price * v[:, -1],
+        "vol_cv":          vol_cv,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def compute_indicators(panel) -> pd.DataFrame:
+    """Screener indicators for every ticker in `panel`, evaluated at each
+    ticker's last bar.
+
+    panel: {ticker: OHLCV DataFrame} (as returned by get_ohlcv_many) or a
+           date × (field, ticker) MultiIndex-column DataFrame.
+
+    Returns a DataFrame indexed by ticker with INDICATOR_COLUMNS. Values are
+    unrounded floats. Tickers with fewer than 2 bars are omitted.
+    `high_20d` is NaN below 20 bars and `vol_cv` NaN below 11 bars or on
+    zero volume — screen_ticker's own guards.
+    """
+    groups: dict[int, list[tuple[str, dict[str, np.ndarray]]]] = {}
+    for ticker, df in _to_frames(panel).items():
+        arrays = _compact(df)
+        if arrays is not None:
+            groups.setdefault(len(arrays["Close"]), []).append((ticker, arrays))
+
+    frames = []
+    for members in groups.values():
+        stacked = {
+            f: np.ascontiguousarray(np.vstack([a[f] for _, a in members]))
+            for f in _FIELDS
+        }
+        cols = _group_indicators(
+            stacked["Open"], stacked["High"], stacked["Low"],
+            stacked["Close"], stacked["Volume"],
+        )
+        frames.append(pd.DataFrame(cols, index=[t for t, _ in members]))
+
+    if not frames:
+        return pd.DataFrame(columns=INDICATOR_COLUMNS)
+    return pd.concat(frames)[INDICATOR_COLUMNS]
@@ -3,7 +3,8 @@ core/research/sweep.py — Orchestrate a parameter sweep over historical signals
 
 Design:
   1. Load raw signals from screener.db once.
-  2. Pre-fetch OHLCV price data for every unique ticker once (shared across all param sets).
+  2. Pre-fetch OHLCV price data for every unique ticker once, in one batched
+     download (shared across all param sets).
   3. For each SweepParams in the grid:
        a. Re-score signals with the param set's weight overrides.
        b. Filter using threshold params.
@@ -26,7 +27,7 @@ from typing import Callable
 
 import pandas as pd
 
-from core.backtest_engine import fetch_ticker_data, run_backtest
+from core.backtest_engine import fetch_many_ticker_data, fetch_ticker_data, run_backtest
 from core.research.params import SweepParams
 from core.research.rescore import (
     build_signal_groups,
@@ -49,11 +50,18 @@ def prefetch_price_data(
     progress_cb: Callable[[str], None] | None = None,
 ) -> dict[str, pd.DataFrame]:
     """
-    Fetch OHLCV for every ticker in signal_groups concurrently.
+    Fetch OHLCV for every ticker in signal_groups.
+
+    One batched download covers the whole universe; tickers that come back
+    empty are retried individually on `max_workers` threads (a batch can drop
+    a symbol that a single-ticker request still serves).
 
     Returns {ticker: DataFrame} (empty DataFrame if fetch failed).
     """
-    price_cache: dict[str, pd.DataFrame] = {}
+    try:
+        price_cache = fetch_many_ticker_data(signal_groups)
+    except Exception:
+        price_cache = {ticker: pd.DataFrame() for ticker in signal_groups}
 
     def _fetch(ticker: str, signals: list[dict]) -> tuple[str, pd.DataFrame]:
         try:
@@ -61,16 +69,19 @@ def prefetch_price_data(
         except Exception:
             return ticker, pd.DataFrame()
 
+    retry = {t: sigs for t, sigs in signal_groups.items() if price_cache[t].empty and sigs}
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {
             pool.submit(_fetch, ticker, sigs): ticker
-            for ticker, sigs in signal_groups.items()
+            for ticker, sigs in retry.items()
         }
         for fut in as_completed(futures):
             ticker, data = fut.result()
             price_cache[ticker] = data
-            if progress_cb:
-                progress_cb(ticker)
+
+    if progress_cb:
+        for ticker in signal_groups:
+            progress_cb(ticker)
 
     return price_cache
 
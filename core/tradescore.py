@@ -13,6 +13,7 @@ Practical range: 0–65. Negative values clipped to 0.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------
@@ -72,6 +73,50 @@ def _lerp(val: float, lo: float, hi: float) -> float:
     return _clamp((val - lo) / (hi - lo))
 
 
+# Array counterparts for compute_tradescore_batch. Each reproduces the scalar
+# helper's exact semantics, NaN handling included: Python's min/max keep the
+# first argument unless the second compares strictly less/greater, so
+# _clamp(nan) returns hi.
+
+def _clamp_arr(v: np.ndarray, lo: float = 0.0, hi: float = 1.0) -> np.ndarray:
+    m = np.where(v < hi, v, hi)
+    return np.where(m > lo, m, lo)
+
+
+def _lerp_arr(val: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    if hi <= lo:
+        return np.where(val >= hi, 1.0, 0.0)
+    return _clamp_arr((val - lo) / (hi - lo))
+
+
+def _round_arr(x: np.ndarray, ndigits: int) -> np.ndarray:
+    """Python's round(x, ndigits) elementwise, bit for bit.
+
+    round() rounds the exact binary value half-to-even, while np.round rounds
+    the already-rounded product x·10ⁿ. The residual of that product is
+    recovered exactly (Veltkamp split; 10ⁿ has few significant bits) and used
+    to correct the rare halfway cases.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    scale = 10.0 ** ndigits
+    p = x * scale
+    d = np.rint(p)
+    with np.errstate(invalid="ignore", over="ignore"):
+        c  = 134217729.0 * x
+        xh = c - (c - x)
+        xl = x - xh
+        e  = (xh * scale - p) + xl * scale
+        frac = p - d
+        d = d + ((frac == 0.5) & (e > 0)) - ((frac == -0.5) & (e < 0))
+        out = d / scale
+    # Beyond 2⁵² the product has no fractional bits left to correct; those
+    # (never seen in scoring) fall back to round() itself.
+    big = ~(np.abs(p) < 2.0 ** 52)
+    if big.any():
+        out[big] = [round(float(v), ndigits) for v in x[big]]
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Sub-score functions
 # ---------------------------------------------------------------------------
@@ -509,6 +554,346 @@ def compute_tradescore(
     }
 
 
+# ---------------------------------------------------------------------------
+# Batch scoring
+# ---------------------------------------------------------------------------
+
+BATCH_COMPONENT_COLUMNS = [
+    "rvol_pts", "change_pts", "macd_pts",
+    "rsi_pts", "ema_pts", "bob_pts",
+    "rsi_pen", "day_pen", "vwap_pen", "run5_pen",
+    "dvol_pts", "qual_pts", "cons_pts",
+]
+
+BATCH_COLUMNS = [
+    "score", "momentum_score", "early_entry", "extension_risk", "liquidity",
+    "news_catalyst", "direction", "setup_type", "change_5d",
+] + BATCH_COMPONENT_COLUMNS
+
+
+def _col(df: pd.DataFrame, name: str, default: float) -> np.ndarray:
+    """float(row.get(name, default)) for every row; None becomes NaN."""
+    if name not in df.columns:
+        return np.full(len(df), float(default))
+    return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _present(df: pd.DataFrame, name: str) -> np.ndarray:
+    """row.get(name) is not None for every row. NaN counts as present, as
+    it does for the scalar path when a float column is turned into records."""
+    if name not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    col = df[name]
+    if col.dtype != object:
+        return np.ones(len(df), dtype=bool)
+    return np.fromiter((v is not None for v in col), dtype=bool, count=len(df))
+
+
+def _or(x: np.ndarray, fallback) -> np.ndarray:
+    """`x or fallback` — only zero is falsy; NaN is kept."""
+    return np.where(x == 0, fallback, x)
+
+
+def _trailing(panel, n_rows: int) -> tuple[np.ndarray, np.ndarray]:
+    """(values, lengths) for a per-row trailing series panel."""
+    values = np.asarray(panel, dtype=np.float64)
+    if values.ndim != 2 or values.shape[0] != n_rows:
+        raise ValueError(f"panel must be 2-D with one row per df row ({n_rows}), got {values.shape}")
+    return values, (~np.isnan(values)).sum(axis=1)
+
+
+def _batch_momentum(rvol, change_pct, macd, macd_sig, atr_val, w):
+    ms_rvol_ideal   = w.get("ms_rvol_ideal",   MS_RVOL_IDEAL)
+    ms_rvol_max_pts = w.get("ms_rvol_max_pts", MS_RVOL_MAX_PTS)
+    ms_chg_hi_pct   = w.get("ms_chg_hi_pct",   MS_CHG_HI_PCT)
+    ms_chg_max_pts  = w.get("ms_chg_max_pts",  MS_CHG_MAX_PTS)
+    ms_macd_max_pts = w.get("ms_macd_max_pts", MS_MACD_MAX_PTS)
+
+    ramp = (rvol > 0) & (rvol <= ms_rvol_ideal)
+    excess   = _clamp_arr((rvol - ms_rvol_ideal) / ms_rvol_ideal)
+    rvol_pts = ms_rvol_max_pts * (1.0 - 0.2 * excess)
+    # Python float pow (libm) — np.power may use a different SIMD kernel
+    base = (rvol[ramp] / ms_rvol_ideal).tolist()
+    rvol_pts[ramp] = ms_rvol_max_pts * np.array([b ** 0.6 for b in base], dtype=np.float64)
+    rvol_pts = np.where(rvol <= 0, 0.0, rvol_pts)
+    rvol_pts = _clamp_arr(rvol_pts, 0, ms_rvol_max_pts)
+
+    decay   = 1.0 - (change_pct - ms_chg_hi_pct) / 25.0
+    chg_pts = np.select(
+        [change_pct <= 0, change_pct <= ms_chg_hi_pct],
+        [0.0, ms_chg_max_pts * (change_pct / ms_chg_hi_pct)],
+        ms_chg_max_pts * np.where(decay > 0.4, decay, 0.4),
+    )
+    chg_pts = _clamp_arr(chg_pts, 0, ms_chg_max_pts)
+
+    macd_norm = (macd - macd_sig) / atr_val
+    macd_pts  = _clamp_arr((macd_norm + 0.1) / 0.2) * ms_macd_max_pts
+
+    return rvol_pts + chg_pts + macd_pts, rvol_pts, chg_pts, macd_pts
+
+
+def _batch_early_entry(rsi_val, price, ema20, hi_20, has_hi, w):
+    ee_rsi_lo      = w.get("ee_rsi_lo",       EE_RSI_LO)
+    ee_rsi_hi      = w.get("ee_rsi_hi",       EE_RSI_HI)
+    ee_rsi_max_pts = w.get("ee_rsi_max_pts",  EE_RSI_MAX_PTS)
+    ee_ema_near    = w.get("ee_ema_near_pct", EE_EMA_NEAR_PCT)
+    ee_ema_far     = w.get("ee_ema_far_pct",  EE_EMA_FAR_PCT)
+    ee_ema_max_pts = w.get("ee_ema_max_pts",  EE_EMA_MAX_PTS)
+    ee_bob_max_pts = w.get("ee_bob_max_pts",  EE_BOB_MAX_PTS)
+
+    rsi_pts = np.select(
+        [
+            (ee_rsi_lo <= rsi_val) & (rsi_val <= ee_rsi_hi),
+            (42 <= rsi_val) & (rsi_val < ee_rsi_lo),
+            (ee_rsi_hi < rsi_val) & (rsi_val <= 76),
+        ],
+        [
+            float(ee_rsi_max_pts),
+            ee_rsi_max_pts * _lerp_arr(rsi_val, 42, ee_rsi_lo),
+            ee_rsi_max_pts * (1.0 - _lerp_arr(rsi_val, ee_rsi_hi, 76)),
+        ],
+        0.0,
+    )
+
+    dist_pct = np.where(ema20 > 0, np.abs(price - ema20) / ema20 * 100, ee_ema_far)
+    ema_pts = np.select(
+        [dist_pct <= ee_ema_near, dist_pct <= ee_ema_far],
+        [float(ee_ema_max_pts), ee_ema_max_pts * (1.0 - _lerp_arr(dist_pct, ee_ema_near, ee_ema_far))],
+        0.0,
+    )
+
+    pct_hi  = price / hi_20
+    bob_pts = np.select(
+        [pct_hi >= 0.97, pct_hi >= 0.85],
+        [float(ee_bob_max_pts), ee_bob_max_pts * _lerp_arr(pct_hi, 0.85, 0.97)],
+        0.0,
+    )
+    bob_pts = np.where(has_hi & (hi_20 > 0), bob_pts, 0.0)
+
+    return rsi_pts + ema_pts + bob_pts, rsi_pts, ema_pts, bob_pts
+
+
+def _batch_extension_risk(rsi_val, change_pct, price, vwap, atr_val, run5, has_run5, w):
+    er_rsi_warn    = w.get("er_rsi_warn",    ER_RSI_WARN)
+    er_rsi_hard    = w.get("er_rsi_hard",    ER_RSI_HARD)
+    er_rsi_max_pts = w.get("er_rsi_max_pts", ER_RSI_MAX_PTS)
+    er_day_warn    = w.get("er_day_warn",    ER_DAY_WARN)
+    er_day_hard    = w.get("er_day_hard",    ER_DAY_HARD)
+    er_day_max_pts = w.get("er_day_max_pts", ER_DAY_MAX_PTS)
+    er_vwap_warn   = w.get("er_vwap_warn",   ER_VWAP_WARN)
+    er_vwap_hard   = w.get("er_vwap_hard",   ER_VWAP_HARD)
+    er_vwap_max    = w.get("er_vwap_max_pts",ER_VWAP_MAX_PTS)
+    er_5d_warn     = w.get("er_5d_warn",     ER_5D_WARN)
+    er_5d_hard     = w.get("er_5d_hard",     ER_5D_HARD)
+    er_5d_max_pts  = w.get("er_5d_max_pts",  ER_5D_MAX_PTS)
+
+    rsi_pen  = er_rsi_max_pts * _lerp_arr(rsi_val, er_rsi_warn, er_rsi_hard)
+    day_pen  = er_day_max_pts * _lerp_arr(np.abs(change_pct), er_day_warn, er_day_hard)
+    vwap_pen = er_vwap_max * _lerp_arr(np.abs(price - vwap) / atr_val, er_vwap_warn, er_vwap_hard)
+    run5_pen = np.where(
+        has_run5, er_5d_max_pts * _lerp_arr(np.abs(run5), er_5d_warn, er_5d_hard), 0.0
+    )
+
+    total = rsi_pen + day_pen + vwap_pen + run5_pen
+    return _clamp_arr(total, 0, 20), rsi_pen, day_pen, vwap_pen, run5_pen
+
+
+def _batch_liquidity(dvol, cv, has_cv, market_cap, has_mcap, float_shares, has_float, w):
+    lq_dvol_min     = w.get("lq_dvol_min",     LQ_DVOL_MIN)
+    lq_dvol_full    = w.get("lq_dvol_full",    LQ_DVOL_FULL)
+    lq_dvol_max_pts = w.get("lq_dvol_max_pts", LQ_DVOL_MAX_PTS)
+    lq_qual_max_pts = w.get("lq_qual_max_pts", LQ_QUAL_MAX_PTS)
+    lq_cons_max_pts = w.get("lq_cons_max_pts", LQ_CONS_MAX_PTS)
+
+    dvol_pts = np.select(
+        [dvol >= lq_dvol_full, dvol >= lq_dvol_min],
+        [float(lq_dvol_max_pts), lq_dvol_max_pts * _lerp_arr(dvol, lq_dvol_min, lq_dvol_full)],
+        0.0,
+    )
+
+    tier = np.select(
+        [market_cap >= 10_000_000_000, market_cap >= 2_000_000_000, market_cap >= 500_000_000],
+        [2.0, float(lq_qual_max_pts), 3.0],
+        1.0,
+    )
+    low_float = has_float & (float_shares != 0) & (float_shares < 10_000_000)
+    tier = np.where(low_float, np.where(tier - 2.0 > 0.0, tier - 2.0, 0.0), tier)
+    qual_pts = np.where(has_mcap & (market_cap != 0), tier, 2.0)
+
+    cons = 1.0 - cv
+    cons_pts = np.where(has_cv, lq_cons_max_pts * np.where(cons > 0.0, cons, 0.0), 0.0)
+
+    total = dvol_pts + qual_pts + cons_pts
+    return _clamp_arr(total, 0, 15), dvol_pts, qual_pts, cons_pts
+
+
+def compute_tradescore_batch(
+    df: pd.DataFrame,
+    close_panel=None,
+    weights: dict | None = None,
+    *,
+    volume_panel=None,
+    rationale: bool = False,
+) -> pd.DataFrame:
+    """
+    Columnar compute_tradescore over every row of `df`.
+
+    Values are bit-for-bit identical to calling compute_tradescore on each
+    row dict, including its missing-value fallbacks and rounding.
+
+    Args:
+        df:           one screener row per line; same columns as the scalar
+                      `row` dict. Missing columns take the scalar defaults.
+        close_panel:  optional (len(df) × bars) array/DataFrame of each row's
+                      trailing closes, oldest → newest, left-padded with NaN
+                      for shorter histories. Plays the role of `close`;
+                      only the last 20 bars are read.
+        weights:      constant overrides, as for compute_tradescore.
+        volume_panel: optional trailing volumes laid out like close_panel.
+                      Plays the role of `data` (dollar volume, consistency).
+        rationale:    also build the rationale strings (a per-row Python
+                      loop — off by default).
+
+    Returns a DataFrame on df's index with BATCH_COLUMNS (plus "rationale"
+    when requested).
+    """
+    w = weights or {}
+    n = len(df)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        price_raw  = _col(df, "price", 1)
+        change_pct = _col(df, "change_pct", 0)
+        rsi_val    = _col(df, "rsi", 50)
+        atr_val    = _or(_col(df, "atr", 0.01), 0.01)
+
+        # close-derived inputs, falling back to stored columns
+        hi_20, has_hi = _col(df, "high_20d", np.nan), _present(df, "high_20d")
+        run5, has_run5 = _col(df, "change_5d", np.nan), _present(df, "change_5d")
+        change_5d = np.where(has_run5, run5, 0.0)
+        if close_panel is not None:
+            closes, n_close = _trailing(close_panel, n)
+            if closes.shape[1]:
+                long_20 = n_close >= 20
+                hi_20  = np.where(long_20, closes[:, -20:].max(axis=1), hi_20)
+                has_hi = long_20 | has_hi
+            if closes.shape[1] >= 6:
+                long_6 = n_close >= 6
+                run_c  = (closes[:, -1] / closes[:, -6] - 1) * 100
+                run5      = np.where(long_6, run_c, run5)
+                has_run5  = long_6 | has_run5
+                change_5d = np.where(long_6, _round_arr(run_c, 2), change_5d)
+
+        # volume-derived inputs, falling back to stored columns
+        lq_price = _col(df, "price", 0)
+        dvol = np.where(_present(df, "dollar_volume"), _col(df, "dollar_volume", 0), 0.0)
+        cv, has_cv = _col(df, "vol_cv", np.nan), _present(df, "vol_cv")
+        if volume_panel is not None:
+            vols, n_vol = _trailing(volume_panel, n)
+            if vols.shape[1]:
+                dvol = np.where(n_vol > 0, lq_price * vols[:, -1], dvol)
+            if vols.shape[1] >= 11:
+                win   = np.ascontiguousarray(vols[:, -11:-1])
+                mean  = win.sum(axis=1) / 10
+                var   = ((mean[:, None] - win) ** 2).sum(axis=1) / 9
+                long_11 = n_vol >= 11
+                cv     = np.where(long_11, np.sqrt(var) / mean, cv)
+                has_cv = np.where(long_11, mean > 0, has_cv)
+
+        ms, rvol_pts, chg_pts, macd_pts = _batch_momentum(
+            _col(df, "rvol", 0), change_pct,
+            _col(df, "macd", 0), _col(df, "macd_signal", 0), atr_val, w,
+        )
+        ee, rsi_pts, ema_pts, bob_pts = _batch_early_entry(
+            rsi_val, _or(price_raw, 1.0), _or(_col(df, "ema20", 0), price_raw),
+            hi_20, has_hi, w,
+        )
+        er, rsi_pen, day_pen, vwap_pen, run5_pen = _batch_extension_risk(
+            rsi_val, change_pct, price_raw,
+            _or(_col(df, "vwap", np.nan) if "vwap" in df.columns else price_raw, price_raw),
+            atr_val, run5, has_run5, w,
+        )
+        lq, dvol_pts, qual_pts, cons_pts = _batch_liquidity(
+            dvol, cv, has_cv,
+            _col(df, "market_cap", np.nan), _present(df, "market_cap"),
+            _col(df, "float_shares", np.nan), _present(df, "float_shares"),
+            w,
+        )
+
+        ms_val, ee_val = _round_arr(ms, 2), _round_arr(ee, 2)
+        er_val, lq_val = _round_arr(er, 2), _round_arr(lq, 2)
+        nc_val = np.zeros(n)
+        raw_final = ms_val + ee_val + lq_val + nc_val - er_val
+        final = _round_arr(np.where(raw_final > 0.0, raw_final, 0.0), 1)
+
+        # Direction: long when price above VWAP and short-term EMA above medium-term.
+        d_price = _col(df, "price", 0)
+        d_vwap, d_ema9, d_ema20 = (
+            _or(_col(df, k, np.nan) if k in df.columns else d_price, d_price)
+            for k in ("vwap", "ema9", "ema20")
+        )
+    direction = np.select(
+        [(d_price > d_vwap) & (d_ema9 >= d_ema20), (d_price < d_vwap) & (d_ema9 <= d_ema20)],
+        ["long", "short"],
+        "neutral",
+    ).astype(object)
+
+    # Same precedence as _setup_type
+    net = ms_val + ee_val - er_val
+    label = np.select(
+        [
+            lq_val <= 3,
+            er_val >= 15,
+            (np.abs(change_pct) >= 15.0) & (ms_val >= 10),
+            (ms_val >= 13) & (er_val >= 8),
+            (ms_val >= 17) & (ee_val >= 15) & (er_val <= 7),
+            (ms_val >= 13) & (ee_val >= 11) & (er_val <= 9),
+            net >= 20,
+            net >= 10,
+        ],
+        [
+            "Low quality / illiquid", "Overextended", "Strong but extended",
+            "Strong but extended", "Early breakout", "Emerging momentum",
+            "Emerging momentum", "Momentum watchlist",
+        ],
+        "Avoid",
+    ).astype(object)
+    short = direction == "short"
+    label[short] = [_BEARISH_LABELS.get(s, s) for s in label[short]]
+
+    out = pd.DataFrame({
+        "score":          final,
+        "momentum_score": ms_val,
+        "early_entry":    ee_val,
+        "extension_risk": er_val,
+        "liquidity":      lq_val,
+        "news_catalyst":  nc_val,
+        "direction":      direction,
+        "setup_type":     label,
+        "change_5d":      change_5d,
+        "rvol_pts":   _round_arr(rvol_pts, 2),
+        "change_pts": _round_arr(chg_pts, 2),
+        "macd_pts":   _round_arr(macd_pts, 2),
+        "rsi_pts":    _round_arr(rsi_pts, 2),
+        "ema_pts":    _round_arr(ema_pts, 2),
+        "bob_pts":    _round_arr(bob_pts, 2),
+        "rsi_pen":    _round_arr(rsi_pen, 2),
+        "day_pen":    _round_arr(day_pen, 2),
+        "vwap_pen":   _round_arr(vwap_pen, 2),
+        "run5_pen":   _round_arr(run5_pen, 2),
+        "dvol_pts":   _round_arr(dvol_pts, 2),
+        "qual_pts":   _round_arr(qual_pts, 2),
+        "cons_pts":   _round_arr(cons_pts, 2),
+    }, index=df.index)
+
+    if rationale:
+        out["rationale"] = [
+            _build_rationale(r, ms_v, ee_v, er_v, setup, c5)
+            for r, ms_v, ee_v, er_v, setup, c5 in zip(
+                df.to_dict("records"), ms_val, ee_val, er_val, label, change_5d
+            )
+        ]
+    return out
+
+
 def conviction_label(score: float, setup_type: str = "") -> str:
     """Kept for backwards compat — returns the setup_type label directly."""
     return setup_type if setup_type else (
@@ -33,6 +33,33 @@ class MarketDataProvider(ABC):
         """OHLCV bars for a fixed date range. Used by backtests."""
         ...
 
+    def get_ohlcv_many(
+        self,
+        tickers: list[str],
+        period: str | None = None,
+        interval: str = "1d",
+        *,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """OHLCV bars for many tickers at once — pass either `period` or `start`/`end`.
+
+        Returns {ticker: DataFrame} with an entry for every requested ticker;
+        a ticker that fails to load maps to an empty DataFrame rather than
+        raising. The default implementation loops the single-ticker methods —
+        providers with a batch endpoint should override it.
+        """
+        out: dict[str, pd.DataFrame] = {}
+        for ticker in dict.fromkeys(tickers):
+            try:
+                if start is not None:
+                    out[ticker] = self.get_ohlcv_range(ticker, start=start, end=end, interval=interval)
+                else:
+                    out[ticker] = self.get_ohlcv(ticker, period, interval)
+            except Exception:
+                out[ticker] = pd.DataFrame()
+        return out
+
     @abstractmethod
     def get_quote(self, ticker: str) -> Quote:
         """Live price, open, previous close, market cap.
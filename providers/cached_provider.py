@@ -0,0 +1,363 @@
+"""
+providers/cached_provider.py — Persistent local OHLCV bar store.
+
+`CachedMarketDataProvider` decorates any `MarketDataProvider` with an on-disk
+SQLite bar store keyed by (ticker, interval). Each key keeps one contiguous
+coverage window [start, end) of calendar dates the store is authoritative
+for; a request is answered from the store and only the missing head/tail
+dates are fetched from the wrapped provider.
+
+Today's bars are never treated as final — coverage stops at today, so the
+forming session is re-fetched (one small tail request) on every call.
+
+Quotes, fundamentals and option chains pass straight through uncached.
+
+Usage:
+    _provider = CachedMarketDataProvider(YFinanceProvider())
+    _provider.get_ohlcv("SPY", "1y", "1d")        # cold: full fetch
+    _provider.get_ohlcv("SPY", "1y", "1d")        # warm: today's tail only
+    _provider.stats()                              # hits / misses / bytes
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Generator
+
+import pandas as pd
+
+from core.db import get_connection
+from data.models import Fundamentals, Quote
+from providers.base import MarketDataProvider
+
+BAR_STORE_PATH = os.environ.get(
+    "TRADESTRATEGY_BAR_STORE",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "bars.db"),
+)
+
+# Intervals whose bars are whole sessions — stored by date, returned tz-naive.
+# Anything else is intraday — stored as UTC timestamps, returned tz-aware UTC.
+_DAILY_INTERVALS = {"1d", "5d", "1wk", "1mo", "3mo"}
+
+_OHLCV_COLS = ["Open", "High", "Low", "Close", "Volume"]
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|mo|y)$")
+
+_DDL_BARS = """
+CREATE TABLE IF NOT EXISTS bars (
+    ticker   TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts       TEXT NOT NULL,
+    open     REAL,
+    high     REAL,
+    low      REAL,
+    close    REAL,
+    volume   REAL,
+    PRIMARY KEY (ticker, interval, ts)
+) WITHOUT ROWID
+"""
+
+_DDL_COVERAGE = """
+CREATE TABLE IF NOT EXISTS bar_coverage (
+    ticker     TEXT NOT NULL,
+    interval   TEXT NOT NULL,
+    start      TEXT NOT NULL,
+    end        TEXT NOT NULL,
+    fetched_at TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (ticker, interval)
+)
+"""
+
+
+def _iso(d: date) -> str:
+    return d.strftime("%Y-%m-%d")
+
+
+def _parse_period(period: str, today: date) -> tuple[date, int | None] | None:
+    """Map a yfinance period string to (start_date, n_sessions).
+
+    n_sessions is set for day periods ("20d" = the last 20 sessions); the
+    start date then carries enough buffer for weekends and holidays.
+    Returns None for periods the store can't express ("max").
+    """
+    if period == "ytd":
+        return date(today.year, 1, 1), None
+    m = _PERIOD_RE.match(period or "")
+    if not m:
+        return None
+    n, unit = int(m.group(1)), m.group(2)
+    if unit == "d":
+        return today - timedelta(days=math.ceil(n * 7 / 5) + 10), n
+    months = n if unit == "mo" else 12 * n
+    return (pd.Timestamp(today) - pd.DateOffset(months=months)).date(), None
+
+
+# ---------------------------------------------------------------------------
+# SQLite bar store
+# ---------------------------------------------------------------------------
+
+class BarStore:
+    """SQLite table of OHLCV bars plus a per-(ticker, interval) coverage window."""
+
+    def __init__(self, db_path: str = BAR_STORE_PATH) -> None:
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(_DDL_BARS)
+            conn.execute(_DDL_COVERAGE)
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = get_connection(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def coverage(self, ticker: str, interval: str) -> tuple[str, str] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT start, end FROM bar_coverage WHERE ticker = ? AND interval = ?",
+                (ticker, interval),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def write(
+        self, ticker: str, interval: str, bars: pd.DataFrame, start: str, end: str
+    ) -> None:
+        """Upsert `bars` and widen the coverage window to include [start, end)."""
+        rows = _to_rows(bars, interval)
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?,?,?,?,?,?,?,?)",
+                [(ticker, interval, *r) for r in rows],
+            )
+            cur = conn.execute(
+                "SELECT start, end FROM bar_coverage WHERE ticker = ? AND interval = ?",
+                (ticker, interval),
+            ).fetchone()
+            if cur:
+                start, end = min(start, cur[0]), max(end, cur[1])
+            conn.execute(
+                "INSERT OR REPLACE INTO bar_coverage (ticker, interval, start, end) "
+                "VALUES (?,?,?,?)",
+                (ticker, interval, start, end),
+            )
+
+    def read(self, ticker: str, interval: str, start: str, end: str) -> pd.DataFrame:
+        """Stored bars with start <= bar date < end."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT ts, open, high, low, close, volume FROM bars "
+                "WHERE ticker = ? AND interval = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (ticker, interval, start, end),
+            ).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=_OHLCV_COLS)
+        df = pd.DataFrame(rows, columns=["ts", *_OHLCV_COLS])
+        if interval in _DAILY_INTERVALS:
+            idx = pd.DatetimeIndex(pd.to_datetime(df["ts"]), name="Date")
+        else:
+            idx = pd.DatetimeIndex(pd.to_datetime(df["ts"], utc=True), name="Datetime")
+        return df[_OHLCV_COLS].set_index(idx)
+
+    def size_bytes(self) -> int:
+        total = 0
+        for suffix in ("", "-wal"):
+            try:
+                total += os.path.getsize(self.db_path + suffix)
+            except OSError:
+                pass
+        return total
+
+
+def _to_rows(bars: pd.DataFrame, interval: str) -> list[tuple]:
+    if bars is None or bars.empty:
+        return []
+    idx = bars.index
+    if interval in _DAILY_INTERVALS:
+        if idx.tz is not None:
+            idx = idx.tz_localize(None)     # keep the exchange's session date
+        keys = idx.strftime("%Y-%m-%d")
+    else:
+        idx = idx.tz_convert("UTC") if idx.tz is not None else idx.tz_localize("UTC")
+        keys = idx.strftime("%Y-%m-%dT%H:%M:%S")
+    cols = [bars[c] if c in bars.columns else pd.Series(float("nan"), index=bars.index)
+            for c in _OHLCV_COLS]
+    return [
+        (k, *(None if pd.isna(v) else float(v) for v in vals))
+        for k, *vals in zip(keys, *cols)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Caching decorator
+# ---------------------------------------------------------------------------
+
+class CachedMarketDataProvider(MarketDataProvider):
+    """`MarketDataProvider` decorator that serves OHLCV from a local `BarStore`."""
+
+    def __init__(self, inner: MarketDataProvider, store: BarStore | None = None) -> None:
+        self.inner = inner
+        self._store_obj = store
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bars_fetched": 0, "bars_served": 0}
+
+    @property
+    def store(self) -> BarStore:
+        # Opened on first use so module-level singletons don't touch disk at import.
+        if self._store_obj is None:
+            self._store_obj = BarStore()
+        return self._store_obj
+
+    # ── OHLCV ──────────────────────────────────────────────────────────────
+
+    def get_ohlcv(self, ticker: str, period: str, interval: str) -> pd.DataFrame:
+        today  = date.today()
+        parsed = _parse_period(period, today)
+        if parsed is None:
+            self._count(hit=False)
+            return self.inner.get_ohlcv(ticker, period, interval)
+        start, n_sessions = parsed
+        df = self.get_ohlcv_range(ticker, _iso(start), _iso(today + timedelta(days=1)), interval)
+        return _last_sessions(df, n_sessions)
+
+    def get_ohlcv_range(
+        self, ticker: str, start: str, end: str | None = None, interval: str = "1d"
+    ) -> pd.DataFrame:
+        end = end or _iso(date.today() + timedelta(days=1))
+        gaps = self._gaps(ticker, interval, start, end)
+        for g_start, g_end in gaps:
+            try:
+                bars = self.inner.get_ohlcv_range(ticker, start=g_start, end=g_end, interval=interval)
+            except Exception:
+                continue
+            self._store(ticker, interval, bars, g_start, g_end)
+        return self._serve(ticker, interval, start, end, hit=not gaps)
+
+    def get_ohlcv_many(
+        self,
+        tickers: list[str],
+        period: str | None = None,
+        interval: str = "1d",
+        *,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Batched lookup: tickers sharing the same missing window are fetched
+        together in one `inner.get_ohlcv_many` call (on a warm store that is
+        usually a single request for today's tail across the universe)."""
+        tickers = list(dict.fromkeys(tickers))
+        today = date.today()
+        n_sessions = None
+        if start is None:
+            parsed = _parse_period(period, today)
+            if parsed is None:
+                self._count(hit=False, n=len(tickers))
+                return self.inner.get_ohlcv_many(tickers, period, interval)
+            start_d, n_sessions = parsed
+            start = _iso(start_d)
+        end = end or _iso(today + timedelta(days=1))
+
+        by_window: dict[tuple[str, str], list[str]] = {}
+        missed: set[str] = set()
+        for t in tickers:
+            for gap in self._gaps(t, interval, start, end):
+                by_window.setdefault(gap, []).append(t)
+                missed.add(t)
+
+        for (g_start, g_end), group in by_window.items():
+            try:
+                fetched = self.inner.get_ohlcv_many(group, interval=interval, start=g_start, end=g_end)
+            except Exception:
+                continue
+            for t in group:
+                self._store(t, interval, fetched.get(t), g_start, g_end)
+
+        return {
+            t: _last_sessions(self._serve(t, interval, start, end, hit=t not in missed), n_sessions)
+            for t in tickers
+        }
+
+    # ── Pass-through ───────────────────────────────────────────────────────
+
+    def get_quote(self, ticker: str) -> Quote:
+        return self.inner.get_quote(ticker)
+
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
+        return self.inner.get_fundamentals(ticker)
+
+    def get_expiries(self, ticker: str) -> tuple[str, ...]:
+        return self.inner.get_expiries(ticker)
+
+    def get_option_chain(self, ticker: str, expiry: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        return self.inner.get_option_chain(ticker, expiry)
+
+    # ── Stats ──────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Request counters since construction plus the store's size on disk.
+
+        hits         requests answered entirely from the store
+        misses       requests that needed at least one remote fetch
+        bars_fetched bars written from the wrapped provider
+        bars_served  bars returned to callers
+        bytes        SQLite file size (incl. WAL)
+        """
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["bytes"] = self.store.size_bytes()
+        return out
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _gaps(self, ticker: str, interval: str, start: str, end: str) -> list[tuple[str, str]]:
+        """Date windows of [start, end) the store is not authoritative for."""
+        cov = self.store.coverage(ticker, interval)
+        if cov is None:
+            return [(start, end)]
+        cov_start, cov_end = cov
+        # A request entirely before/after the window still fetches up to its
+        # edge, so coverage stays one contiguous range.
+        gaps = []
+        if start < cov_start:
+            gaps.append((start, cov_start))
+        if end > cov_end:
+            gaps.append((cov_end, end))
+        return gaps
+
+    def _store(self, ticker: str, interval: str, bars, start: str, end: str) -> None:
+        if bars is None or bars.empty:
+            return   # an empty answer may be a transient failure — don't mark it covered
+        # Today's session may still be forming: store it, but stop coverage
+        # at today so the next request re-fetches it.
+        self.store.write(ticker, interval, bars, start, min(end, _iso(date.today())))
+        with self._stats_lock:
+            self._stats["bars_fetched"] += len(bars)
+
+    def _serve(self, ticker: str, interval: str, start: str, end: str, *, hit: bool) -> pd.DataFrame:
+        df = self.store.read(ticker, interval, start, end)
+        self._count(hit=hit, served=len(df))
+        return df
+
+    def _count(self, *, hit: bool, n: int = 1, served: int = 0) -> None:
+        with self._stats_lock:
+            self._stats["hits" if hit else "misses"] += n
+            self._stats["bars_served"] += served
+
+
+def _last_sessions(df: pd.DataFrame, n_sessions: int | None) -> pd.DataFrame:
+    """Keep the bars belonging to the last `n_sessions` distinct dates."""
+    if n_sessions is None or df.empty:
+        return df
+    session_dates = pd.Index(df.index.date)
+    keep = set(session_dates.unique()[-n_sessions:])
+    return df[session_dates.isin(keep)]
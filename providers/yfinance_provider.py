@@ -18,6 +18,36 @@ import pandas as pd
 from providers.base import MarketDataProvider
 from data.models import Fundamentals, Quote
 
+# Tickers per yf.download call. yfinance fans each batch out over its own
+# thread pool; very large batches start tripping Yahoo's rate limiter.
+DOWNLOAD_CHUNK_SIZE = 100
+
+_OHLCV_COLS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _split_download(raw: pd.DataFrame, chunk: list[str]) -> dict[str, pd.DataFrame]:
+    """Split a group_by="ticker" yf.download frame into per-ticker OHLCV frames.
+
+    Rows where the ticker has no close are dropped — the batch index is the
+    union of every ticker's calendar (crypto trades weekends, equities don't).
+    """
+    out: dict[str, pd.DataFrame] = {}
+    multi = isinstance(raw.columns, pd.MultiIndex)
+    for ticker in chunk:
+        try:
+            if multi:
+                if ticker not in raw.columns.get_level_values(0):
+                    out[ticker] = pd.DataFrame()
+                    continue
+                df = raw[ticker]
+            else:
+                df = raw   # single-ticker download with flat columns
+            df = df[[c for c in _OHLCV_COLS if c in df.columns]].dropna(subset=["Close"])
+            out[ticker] = df
+        except Exception:
+            out[ticker] = pd.DataFrame()
+    return out
+
 
 class YFinanceProvider(MarketDataProvider):
 
@@ -29,6 +59,45 @@ class YFinanceProvider(MarketDataProvider):
     ) -> pd.DataFrame:
         return yf.Ticker(ticker).history(start=start, end=end, interval=interval)
 
+    def get_ohlcv_many(
+        self,
+        tickers: list[str],
+        period: str | None = None,
+        interval: str = "1d",
+        *,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Batched OHLCV via chunked `yf.download`.
+
+        A chunk whose download raises falls back to per-ticker `history()`
+        calls so one bad symbol can't blank out its neighbours.
+        """
+        unique = list(dict.fromkeys(tickers))
+        span = {"start": start, "end": end} if start is not None else {"period": period}
+        out: dict[str, pd.DataFrame] = {}
+        for i in range(0, len(unique), DOWNLOAD_CHUNK_SIZE):
+            chunk = unique[i:i + DOWNLOAD_CHUNK_SIZE]
+            try:
+                raw = yf.download(
+                    chunk,
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=True,
+                    actions=False,
+                    threads=True,
+                    progress=False,
+                    **span,
+                )
+            except Exception:
+                out.update(super().get_ohlcv_many(chunk, period, interval, start=start, end=end))
+                continue
+            if raw is None or raw.empty:
+                out.update({t: pd.DataFrame() for t in chunk})
+                continue
+            out.update(_split_download(raw, chunk))
+        return out
+
     def get_quote(self, ticker: str) -> Quote:
         try:
             fi = yf.Ticker(ticker).fast_info
@@ -4,6 +4,7 @@ TradeStrategy screener pipeline.
 
 Usage:
     python run.py
+    python run.py --workers 8 --timeout 60   # concurrent screening
 
 Schedule this to run before US market open (e.g. 9am ET).
 Results are stored in screener.db.
@@ -12,12 +13,18 @@ Cron example (9am ET, Mon-Fri):
     0 13 * * 1-5 cd /path/to/TradeStrategy && python run.py
 """
 
+import argparse
 import json
 import math
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
 from core.db import get_connection
+from core.indicators import compute_indicators
 
 import pandas as pd
 
@@ -40,10 +47,11 @@ from core.tradescore import (
     ER_VWAP_WARN, ER_VWAP_HARD, ER_VWAP_MAX_PTS, ER_5D_WARN, ER_5D_HARD, ER_5D_MAX_PTS,
     LQ_DVOL_MIN, LQ_DVOL_FULL, LQ_DVOL_MAX_PTS, LQ_QUAL_MAX_PTS, LQ_CONS_MAX_PTS,
 )
+from providers.cached_provider import CachedMarketDataProvider
 from providers.yfinance_provider import YFinanceProvider
 from providers.scraped_provider import FinvizDiscoveryProvider
 
-_provider  = YFinanceProvider()
+_provider  = CachedMarketDataProvider(YFinanceProvider())
 _discovery = FinvizDiscoveryProvider()
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "screener.db")
@@ -220,6 +228,36 @@ def atr(data: pd.DataFrame, period: int = 14) -> float:
     return val if not (val != val) else 0.01  # NaN guard — return near-zero
 
 
+# ---------------------------------------------------------------------------
+# Stage timing
+# ---------------------------------------------------------------------------
+
+class StageTimings:
+    """Thread-safe wall-clock accumulator for the screener's pipeline stages.
+
+    Each `stage(name)` block adds its elapsed seconds to `totals[name]`.
+    Under concurrent screening the totals are summed across workers, so they
+    can exceed the run's overall wall time — that ratio is the speed-up.
+    """
+
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.totals[name] = self.totals.get(name, 0.0) + elapsed
+
+    def summary(self) -> str:
+        return "  ".join(f"{k} {v:.1f}s" for k, v in self.totals.items())
+
+
 # ---------------------------------------------------------------------------
 # Screening
 # ---------------------------------------------------------------------------
@@ -227,28 +265,48 @@ def atr(data: pd.DataFrame, period: int = 14) -> float:
 _STABLECOINS = {"USDC-USD", "DAI-USD", "USDT-USD", "BUSD-USD", "TUSD-USD", "USDP-USD"}
 
 
-def screen_ticker(ticker: str, strategy: str) -> dict | None:
+def screen_ticker(
+    ticker: str,
+    strategy: str,
+    *,
+    data: pd.DataFrame | None = None,
+    indicators: pd.Series | None = None,
+    timings: StageTimings | None = None,
+) -> dict | None:
+    """Screen one ticker. `data` is its pre-fetched 1y daily OHLCV; when
+    None (or empty) the bars are fetched here. `indicators` is its row of
+    core.indicators.compute_indicators over the same bars; when None it is
+    computed here for this ticker alone."""
     if ticker in _STABLECOINS:
         return None  # stablecoins have no trading edge — exclude from ranking
 
-    data = _provider.get_ohlcv(ticker, "1y", "1d")
+    timings = timings or StageTimings()
+
+    if data is None or data.empty:
+        with timings.stage("ohlcv"):
+            data = _provider.get_ohlcv(ticker, "1y", "1d")
     if len(data) < 20:
         return None
 
+    if indicators is None:
+        with timings.stage("indicators"):
+            indicators = compute_indicators({ticker: data}).loc[ticker]
+
     close  = data["Close"]
-    price  = float(close.iloc[-1])
-    change = (price / float(close.iloc[-2]) - 1) * 100
-    rvol   = float(data["Volume"].iloc[-1] / data["Volume"].iloc[:-1].mean())
+    price  = float(indicators["price"])
+    change = float(indicators["change_pct"])
+    rvol   = float(indicators["rvol"])
 
-    ema9   = float(close.ewm(span=9,   adjust=False).mean().iloc[-1])
-    ema20  = float(close.ewm(span=20,  adjust=False).mean().iloc[-1])
-    ema200 = float(close.ewm(span=200, adjust=False).mean().iloc[-1])
-    rsi_val = rsi(close)
-    atr_val = atr(data)
+    ema9    = float(indicators["ema9"])
+    ema20   = float(indicators["ema20"])
+    ema200  = float(indicators["ema200"])
+    rsi_val = float(indicators["rsi"])
+    atr_val = float(indicators["atr"])
 
     # Market cap via get_quote (fast, ~50ms) for all tickers.
     # Full fundamentals (slow) only for momentum strategy where float_shares is needed.
-    market_cap   = _provider.get_quote(ticker).market_cap
+    with timings.stage("quote"):
+        market_cap = _provider.get_quote(ticker).market_cap
     float_shares = None
 
     # Finviz top gainers are filtered strictly; curated lists always pass
@@ -262,7 +320,8 @@ def screen_ticker(ticker: str, strategy: str) -> dict | None:
         return None
 
     if strategy == "momentum":
-        fund         = _provider.get_fundamentals(ticker)
+        with timings.stage("fundamentals"):
+            fund     = _provider.get_fundamentals(ticker)
         market_cap   = fund.market_cap
         float_shares = fund.float_shares
         if not (
@@ -273,15 +332,9 @@ def screen_ticker(ticker: str, strategy: str) -> dict | None:
         ):
             return None
 
-    exp1   = close.ewm(span=12, adjust=False).mean()
-    exp2   = close.ewm(span=26, adjust=False).mean()
-    macd   = float((exp1 - exp2).iloc[-1])
-    macd_s = float((exp1 - exp2).ewm(span=9, adjust=False).mean().iloc[-1])
-    typical_price = (data["High"] + data["Low"] + data["Close"]) / 3
-    vwap = float(
-        (typical_price * data["Volume"]).cumsum().iloc[-1]
-        / data["Volume"].cumsum().iloc[-1]
-    ) if data["Volume"].sum() > 0 else float(typical_price.iloc[-1])
+    macd   = float(indicators["macd"])
+    macd_s = float(indicators["macd_signal"])
+    vwap   = float(indicators["vwap"])
 
     is_crypto = ticker.endswith("-USD")
 
@@ -304,8 +357,7 @@ def screen_ticker(ticker: str, strategy: str) -> dict | None:
         ])
         stop_loss = round(price - 2.0 * atr_val, 4)   # wider stop for crypto volatility
     else:
-        vol3 = data["Volume"].rolling(3).mean()
-        volume_trend_up = int(len(data) >= 7 and float(vol3.iloc[-1]) > float(vol3.iloc[-4]))
+        volume_trend_up = int(indicators["volume_trend_up"])
         score = sum([
             macd > macd_s,
             ema9 > ema20 > ema200,
@@ -339,16 +391,16 @@ def screen_ticker(ticker: str, strategy: str) -> dict | None:
     # Compute faithful re-scoring inputs before calling compute_tradescore.
     # These are stored so research sweeps can reconstruct exact sub-scores
     # without needing the original close series or OHLCV DataFrame.
-    row["high_20d"] = round(float(close.iloc[-20:].max()), 6) if len(close) >= 20 else None
+    _high_20d = float(indicators["high_20d"])
+    row["high_20d"] = None if math.isnan(_high_20d) else round(_high_20d, 6)
 
-    _last_vol   = float(data["Volume"].iloc[-1])
-    row["dollar_volume"] = round(price * _last_vol, 2)
+    row["dollar_volume"] = round(float(indicators["dollar_volume"]), 2)
 
-    _vol_window = data["Volume"].iloc[-11:-1]
-    _vol_mean   = float(_vol_window.mean())
-    row["vol_cv"] = round(float(_vol_window.std() / _vol_mean), 6) if len(_vol_window) >= 10 and _vol_mean > 0 else None
+    _vol_cv = float(indicators["vol_cv"])
+    row["vol_cv"] = None if math.isnan(_vol_cv) else round(_vol_cv, 6)
 
-    ts = compute_tradescore(row, close=close, data=data)
+    with timings.stage("tradescore"):
+        ts = compute_tradescore(row, close=close, data=data)
     row["tradescore"] = ts["score"]
     row["setup_type"] = ts["setup_type"]
     row["rationale"]  = ts["rationale"]
@@ -362,31 +414,134 @@ def screen_ticker(ticker: str, strategy: str) -> dict | None:
 # Entry point
 # ---------------------------------------------------------------------------
 
-def main():
+def prefetch_bars(tickers, timings: StageTimings | None = None) -> dict[str, pd.DataFrame]:
+    """1y daily OHLCV for every screenable ticker in one batched download.
+
+    Never raises — on a failed batch screen_ticker falls back to per-ticker
+    fetches.
+    """
+    timings = timings or StageTimings()
+    with timings.stage("ohlcv"):
+        try:
+            return _provider.get_ohlcv_many(
+                [t for t in tickers if t not in _STABLECOINS], "1y", "1d"
+            )
+        except Exception as e:
+            print(f"  Bulk OHLCV fetch failed, falling back to per-ticker: {e}")
+            return {}
+
+
+def _await_result(fut, started_at: dict, key: str, timeout: float | None):
+    """Wait for `fut`, measuring `timeout` from when its worker picked it up.
+
+    Tasks still queued behind busy workers are not charged for the wait.
+    Raises concurrent.futures.TimeoutError once the ticker's own budget is spent.
+    """
+    if timeout is None:
+        return fut.result()
+    while not fut.done():
+        t0 = started_at.get(key)
+        remaining = 0.25 if t0 is None else t0 + timeout - time.monotonic()
+        if remaining <= 0:
+            raise FutureTimeout()
+        try:
+            return fut.result(timeout=min(remaining, 0.25))
+        except FutureTimeout:
+            continue
+    return fut.result()
+
+
+def screen_all(
+    ticker_map: dict[str, str],
+    *,
+    workers: int = 1,
+    timeout: float | None = None,
+    timings: StageTimings | None = None,
+    bars: dict[str, pd.DataFrame] | None = None,
+    indicators: pd.DataFrame | None = None,
+):
+    """Screen every ticker in `ticker_map` on a bounded thread pool.
+
+    Yields (ticker, strategy, result, error) in `ticker_map` order regardless
+    of completion order, so logging and persistence are identical to a serial
+    pass. `error` is the exception message (or a timeout notice) when the
+    ticker failed; `result` is None for both failures and filtered-out names.
+
+    A timed-out ticker is abandoned, not interrupted — its worker thread
+    finishes the in-flight HTTP call in the background and the result is
+    discarded.
+
+    `bars` maps ticker → pre-fetched OHLCV (see `prefetch_bars`); tickers
+    missing from it are fetched individually inside their worker.
+    `indicators` is compute_indicators(bars); tickers without a row get
+    theirs computed inside their worker.
+    """
+    timings = timings or StageTimings()
+    bars = bars or {}
+    started_at: dict[str, float] = {}
+
+    def _task(ticker: str, strategy: str) -> dict | None:
+        started_at[ticker] = time.monotonic()
+        ind = None
+        if indicators is not None and ticker in indicators.index:
+            ind = indicators.loc[ticker]
+        return screen_ticker(
+            ticker, strategy, data=bars.get(ticker), indicators=ind, timings=timings
+        )
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = [
+            (ticker, strategy, pool.submit(_task, ticker, strategy))
+            for ticker, strategy in ticker_map.items()
+        ]
+        for ticker, strategy, fut in futures:
+            try:
+                yield ticker, strategy, _await_result(fut, started_at, ticker, timeout), None
+            except FutureTimeout:
+                yield ticker, strategy, None, f"timed out after {timeout:g}s"
+            except Exception as e:
+                yield ticker, strategy, None, str(e)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(workers: int = 1, timeout: float | None = None):
+    t_start = time.perf_counter()
+    timings = StageTimings()
+
     init_db()
     run_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    ticker_map = build_ticker_map()
-    print(f"Screening {len(ticker_map)} tickers for {run_date}...")
+    with timings.stage("discovery"):
+        ticker_map = build_ticker_map()
+    print(f"Screening {len(ticker_map)} tickers for {run_date} ({workers} worker{'s' if workers != 1 else ''})...")
 
     results = []
-    for ticker, strategy in ticker_map.items():
-        try:
-            result = screen_ticker(ticker, strategy)
-            if result:
-                results.append(result)
-                print(
-                    f"  PASS [{strategy:8}] {ticker:10} "
-                    f"{result['change_pct']:+.1f}%  "
-                    f"RVOL {result['rvol']:.1f}  "
-                    f"Score {result['score']}/4  "
-                    f"TradeScore {result['tradescore']:.0f}  "
-                    f"[{result.get('explain') and json.loads(result['explain'])['conviction']}]"
-                )
-        except Exception as e:
-            print(f"  ERR  {ticker}: {e}")
+    t_screen = time.perf_counter()
+    bars = prefetch_bars(ticker_map, timings)
+    with timings.stage("indicators"):
+        indicators = compute_indicators(bars)
+    for ticker, strategy, result, error in screen_all(
+        ticker_map, workers=workers, timeout=timeout, timings=timings,
+        bars=bars, indicators=indicators,
+    ):
+        if error is not None:
+            print(f"  ERR  {ticker}: {error}")
+        elif result:
+            results.append(result)
+            print(
+                f"  PASS [{strategy:8}] {ticker:10} "
+                f"{result['change_pct']:+.1f}%  "
+                f"RVOL {result['rvol']:.1f}  "
+                f"Score {result['score']}/4  "
+                f"TradeScore {result['tradescore']:.0f}  "
+                f"[{result.get('explain') and json.loads(result['explain'])['conviction']}]"
+            )
+    screen_wall = time.perf_counter() - t_screen
 
     if results:
-        save_results(run_date, results)
+        with timings.stage("save"):
+            save_results(run_date, results)
         print(f"\n{len(results)} candidates saved to screener.db")
 
         # Top 5 by TradeScore
@@ -415,10 +570,27 @@ def main():
     # Send structured daily brief via Telegram
     try:
         from send_brief import send_daily_brief
-        send_daily_brief(run_date)
+        with timings.stage("brief"):
+            send_daily_brief(run_date)
     except Exception as e:
         print(f"\nDaily brief failed (non-fatal): {e}")
 
+    print(
+        f"\nStage totals: {timings.summary()}"
+        f"\nScreening wall {screen_wall:.1f}s  |  total wall {time.perf_counter() - t_start:.1f}s"
+    )
+    bs = _provider.stats()
+    print(
+        f"Bar store: {bs['hits']} hits  {bs['misses']} misses  "
+        f"{bs['bars_fetched']} bars fetched  {bs['bytes'] / 1e6:.1f} MB on disk"
+    )
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="TradeStrategy screener pipeline")
+    parser.add_argument("--workers", type=int,   default=1,
+                        help="Concurrent screening threads (default 1 = serial)")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Per-ticker timeout in seconds (default: none)")
+    args = parser.parse_args()
+    main(workers=args.workers, timeout=args.timeout)
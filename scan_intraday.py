@@ -101,9 +101,11 @@ def load_tickers(crypto_only: bool = False) -> list[str]:
 # Intraday scan per ticker
 # ---------------------------------------------------------------------------
 
-def scan_ticker(ticker: str) -> dict | None:
+def scan_ticker(ticker: str, hist: pd.DataFrame | None = None) -> dict | None:
+    """`hist` is the ticker's pre-fetched 60d 15m bars; fetched here when None."""
     try:
-        hist = _provider.get_ohlcv(ticker, "60d", "15m")
+        if hist is None or hist.empty:
+            hist = _provider.get_ohlcv(ticker, "60d", "15m")
 
         # Some tokens return empty frames or lack timezone info
         if hist.empty or not hasattr(hist.index, "tz") or hist.index.tz is None:
@@ -294,9 +296,12 @@ def main():
     tickers = load_tickers(crypto_only=args.crypto_only)
     print(f"Scanning {len(tickers)} tickers...\n")
 
+    bars = _provider.get_ohlcv_many(tickers, "60d", "15m")
+
     triggered = []
     for ticker in tickers:
-        result = scan_ticker(ticker)
+        hist   = bars.get(ticker)
+        result = scan_ticker(ticker, hist)
         if result:
             triggered.append(result)
             types_str = "  ".join(
@@ -310,7 +315,8 @@ def main():
             )
         else:
             print(f"  clear  {ticker}")
-        time.sleep(0.2)
+        if hist is None or hist.empty:
+            time.sleep(0.2)   # scan_ticker fell back to a per-ticker fetch
 
     print(f"\n{len(triggered)} alert(s) out of {len(tickers)} tickers.")
 
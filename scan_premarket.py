@@ -35,6 +35,7 @@ def _load_env():
 _load_env()
 
 
+import pandas as pd
 import requests
 
 from providers.yfinance_provider import YFinanceProvider
@@ -114,9 +115,11 @@ def load_tickers() -> list[str]:
 # Per-ticker scan
 # ---------------------------------------------------------------------------
 
-def scan_ticker(ticker: str) -> dict | None:
+def scan_ticker(ticker: str, hist: pd.DataFrame | None = None) -> dict | None:
+    """`hist` is the ticker's pre-fetched 20d 1d bars; fetched here when None."""
     try:
-        hist = _provider.get_ohlcv(ticker, "20d", "1d")
+        if hist is None or hist.empty:
+            hist = _provider.get_ohlcv(ticker, "20d", "1d")
 
         if len(hist) < 3:
             return None
@@ -249,9 +252,11 @@ def main():
     print(f"Watchlist: {len(tickers)} tickers across {len(WATCHLISTS)} files")
     print(f"Thresholds: RVOL >= {RVOL_THRESHOLD}x  |  change >= {CHANGE_THRESHOLD}%  |  gap >= {GAP_THRESHOLD}%\n")
 
+    bars = _provider.get_ohlcv_many(tickers, "20d", "1d")
+
     triggered = []
     for ticker in tickers:
-        result = scan_ticker(ticker)
+        result = scan_ticker(ticker, bars.get(ticker))
         if result:
             triggered.append(result)
             types_str = "  ".join(
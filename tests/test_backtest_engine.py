@@ -19,7 +19,7 @@ import pandas as pd
 import pytest
 from backtesting import Backtest
 
-from core.backtest_engine import ScreenerStrategy, run_backtest
+from core.backtest_engine import ScreenerStrategy, fetch_many_ticker_data, run_backtest
 
 
 # ---------------------------------------------------------------------------
@@ -397,3 +397,32 @@ def test_run_backtest_strips_tz_from_index(mock_fetch):
     result = run_backtest("SPY", [{"date": signal_date, "stop": None, "target": None}])
 
     assert result["error"] is None   # must not raise on tz-aware data
+
+
+# ---------------------------------------------------------------------------
+# fetch_many_ticker_data — batched pre-fetch
+# ---------------------------------------------------------------------------
+
+@patch("core.backtest_engine._provider.get_ohlcv_many")
+def test_fetch_many_ticker_data_one_request_trimmed_per_ticker(mock_many):
+    wide = _make_ohlcv(start="2024-01-01", periods=120)
+    wide.index = wide.index.tz_localize("UTC")
+    mock_many.return_value = {"AAA": wide.copy(), "BBB": wide.copy()}
+
+    groups = {
+        "AAA": [{"date": "2024-01-15"}],
+        "BBB": [{"date": "2024-03-01"}, {"date": "2024-03-20"}],
+        "CCC": [{"date": "2024-02-01"}],   # missing from the batch
+    }
+    out = fetch_many_ticker_data(groups)
+
+    mock_many.assert_called_once()
+    _, kwargs = mock_many.call_args
+    assert kwargs["start"] == "2024-01-05" and kwargs["end"] == "2024-04-19"
+
+    assert out["AAA"].index.tz is None
+    assert out["AAA"].index.min() >= pd.Timestamp("2024-01-05")
+    assert out["AAA"].index.max() <  pd.Timestamp("2024-02-14")
+    assert out["BBB"].index.min() >= pd.Timestamp("2024-02-20")
+    assert out["BBB"].index.max() <  pd.Timestamp("2024-04-19")
+    assert out["CCC"].empty
@@ -0,0 +1,177 @@
+"""
+tests/test_cached_provider.py — Persistent OHLCV bar store.
+
+Covers:
+  - cold request fetches the full range, warm request is served locally
+  - widening a range fetches only the missing head/tail dates
+  - today's bar is always re-fetched (coverage stops at today)
+  - get_ohlcv_many batches tickers that share a missing window
+  - period strings map onto date ranges ("20d" = last 20 sessions)
+  - stats() reports hits, misses and bytes
+  - quotes/fundamentals pass straight through
+
+The wrapped provider is a counting fake — no network I/O.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from data.models import Fundamentals, Quote
+from providers.base import MarketDataProvider
+from providers.cached_provider import BarStore, CachedMarketDataProvider
+
+
+class _FakeProvider(MarketDataProvider):
+    """Deterministic business-day bars; records every range request."""
+
+    def __init__(self):
+        self.range_calls: list[tuple[str, str, str]] = []
+        self.many_calls:  list[tuple[tuple[str, ...], str, str]] = []
+
+    def _bars(self, ticker: str, start: str, end: str) -> pd.DataFrame:
+        idx = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        base = 100.0 + (sum(map(ord, ticker)) % 50)
+        close = [base + (d - pd.Timestamp("2020-01-01")).days * 0.1 for d in idx]
+        return pd.DataFrame({
+            "Open": close, "High": [c + 1 for c in close], "Low": [c - 1 for c in close],
+            "Close": close, "Volume": [1_000_000.0] * len(idx),
+        }, index=idx)
+
+    def get_ohlcv(self, ticker, period, interval):
+        raise AssertionError("cached provider should translate periods to ranges")
+
+    def get_ohlcv_range(self, ticker, start, end, interval="1d"):
+        self.range_calls.append((ticker, start, end))
+        return self._bars(ticker, start, end)
+
+    def get_ohlcv_many(self, tickers, period=None, interval="1d", *, start=None, end=None):
+        self.many_calls.append((tuple(tickers), start, end))
+        return {t: self._bars(t, start, end) for t in tickers}
+
+    def get_quote(self, ticker):
+        return Quote(last_price=1.0, open=1.0, prev_close=1.0, market_cap=None)
+
+    def get_fundamentals(self, ticker):
+        return Fundamentals(name=ticker, market_cap=None, float_shares=None)
+
+    def get_expiries(self, ticker):
+        return ()
+
+    def get_option_chain(self, ticker, expiry):
+        return pd.DataFrame(), pd.DataFrame()
+
+
+@pytest.fixture
+def cached(tmp_path):
+    inner = _FakeProvider()
+    return inner, CachedMarketDataProvider(inner, BarStore(str(tmp_path / "bars.db")))
+
+
+def test_warm_range_is_served_without_fetch(cached):
+    inner, prov = cached
+    cold = prov.get_ohlcv_range("AAPL", "2024-01-01", "2024-03-01")
+    warm = prov.get_ohlcv_range("AAPL", "2024-01-01", "2024-03-01")
+
+    assert len(inner.range_calls) == 1
+    pd.testing.assert_frame_equal(cold, warm)
+    expected = inner._bars("AAPL", "2024-01-01", "2024-03-01")
+    assert list(warm.index) == list(expected.index)
+    assert (warm["Close"].values == expected["Close"].values).all()
+    s = prov.stats()
+    assert (s["hits"], s["misses"]) == (1, 1)
+    assert s["bytes"] > 0
+
+
+def test_sub_range_is_a_hit(cached):
+    inner, prov = cached
+    prov.get_ohlcv_range("AAPL", "2024-01-01", "2024-06-01")
+    sub = prov.get_ohlcv_range("AAPL", "2024-02-01", "2024-03-01")
+
+    assert len(inner.range_calls) == 1
+    assert sub.index.min() >= pd.Timestamp("2024-02-01")
+    assert sub.index.max() <  pd.Timestamp("2024-03-01")
+
+
+def test_wider_range_fetches_only_missing_edges(cached):
+    inner, prov = cached
+    prov.get_ohlcv_range("AAPL", "2024-03-01", "2024-04-01")
+    out = prov.get_ohlcv_range("AAPL", "2024-02-01", "2024-05-01")
+
+    assert inner.range_calls[1:] == [
+        ("AAPL", "2024-02-01", "2024-03-01"),
+        ("AAPL", "2024-04-01", "2024-05-01"),
+    ]
+    assert len(out) == len(inner._bars("AAPL", "2024-02-01", "2024-05-01"))
+
+
+def test_today_is_always_refetched(cached):
+    inner, prov = cached
+    today = date.today()
+    start = (today - timedelta(days=30)).isoformat()
+    end   = (today + timedelta(days=1)).isoformat()
+    prov.get_ohlcv_range("AAPL", start, end)
+    prov.get_ohlcv_range("AAPL", start, end)
+
+    assert inner.range_calls[1] == ("AAPL", today.isoformat(), end)
+
+
+def test_get_ohlcv_many_batches_shared_gap(cached):
+    inner, prov = cached
+    prov.get_ohlcv_many(["AAA", "BBB"], start="2024-01-01", end="2024-02-01")
+    out = prov.get_ohlcv_many(["AAA", "BBB", "CCC"], start="2024-01-01", end="2024-03-01")
+
+    assert inner.many_calls == [
+        (("AAA", "BBB"), "2024-01-01", "2024-02-01"),
+        (("AAA", "BBB"), "2024-02-01", "2024-03-01"),
+        (("CCC",),       "2024-01-01", "2024-03-01"),
+    ]
+    assert set(out) == {"AAA", "BBB", "CCC"}
+    assert len(out["AAA"]) == len(out["CCC"])
+
+    prov.get_ohlcv_many(["AAA", "CCC"], start="2024-01-15", end="2024-02-15")
+    assert len(inner.many_calls) == 3   # fully warm
+
+
+def test_day_period_returns_last_n_sessions(cached):
+    _, prov = cached
+    df = prov.get_ohlcv("SPY", "20d", "1d")
+    assert len(df) == 20
+    assert df.index.max() <= pd.Timestamp(date.today())
+
+
+def test_year_period_maps_to_calendar_range(cached):
+    inner, prov = cached
+    df = prov.get_ohlcv("SPY", "1y", "1d")
+    start = pd.Timestamp(inner.range_calls[0][1])
+    assert start == pd.Timestamp(date.today()) - pd.DateOffset(years=1)
+    assert df.index.min() >= start
+
+
+def test_passthrough_methods(cached):
+    _, prov = cached
+    assert prov.get_quote("AAPL").last_price == 1.0
+    assert prov.get_fundamentals("AAPL").name == "AAPL"
+    assert prov.stats()["hits"] == 0
+
+
+def test_store_persists_across_instances(tmp_path):
+    path  = str(tmp_path / "bars.db")
+    inner = _FakeProvider()
+    CachedMarketDataProvider(inner, BarStore(path)).get_ohlcv_range("MSFT", "2024-01-01", "2024-02-01")
+    CachedMarketDataProvider(inner, BarStore(path)).get_ohlcv_range("MSFT", "2024-01-01", "2024-02-01")
+    assert len(inner.range_calls) == 1
+
+
+def test_intraday_bars_round_trip_as_utc(cached):
+    inner, prov = cached
+    idx = pd.date_range("2024-01-02 09:30", periods=4, freq="15min", tz="America/New_York")
+    bars = pd.DataFrame({c: [1.0, 2.0, 3.0, 4.0] for c in ["Open", "High", "Low", "Close", "Volume"]}, index=idx)
+    inner.get_ohlcv_range = lambda *a, **k: bars
+    out = prov.get_ohlcv_range("SPY", "2024-01-02", "2024-01-03", "15m")
+
+    assert str(out.index.tz) == "UTC"
+    assert out.index[0] == idx[0]
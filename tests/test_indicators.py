@@ -0,0 +1,140 @@
+"""
+tests/test_indicators.py — Cross-sectional indicator engine.
+
+Covers:
+  - compute_indicators is bit-for-bit equal to the per-ticker pandas code
+    run.screen_ticker used (EWM, rolling RSI/ATR, VWAP, volume CV, ...)
+  - flat price runs, all-zero volume and mixed bar counts in one call
+  - MultiIndex panel input matches dict input
+  - short histories are omitted / guarded columns are NaN
+  - screen_ticker produces the same row from a passed-in row or its own
+
+No network I/O.
+"""
+
+from __future__ import annotations
+
+import math
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import run
+from core.indicators import INDICATOR_COLUMNS, compute_indicators
+from run import atr, rsi
+
+
+def _reference(data: pd.DataFrame) -> dict[str, float]:
+    """The pandas per-ticker computations screen_ticker used before the engine."""
+    close = data["Close"]
+    price = float(close.iloc[-1])
+    exp1  = close.ewm(span=12, adjust=False).mean()
+    exp2  = close.ewm(span=26, adjust=False).mean()
+    tp    = (data["High"] + data["Low"] + data["Close"]) / 3
+    vol3  = data["Volume"].rolling(3).mean()
+    win   = data["Volume"].iloc[-11:-1]
+    wmean = float(win.mean())
+    return {
+        "price":           price,
+        "change_pct":      (price / float(close.iloc[-2]) - 1) * 100,
+        "rvol":            float(data["Volume"].iloc[-1] / data["Volume"].iloc[:-1].mean()),
+        "ema9":            float(close.ewm(span=9, adjust=False).mean().iloc[-1]),
+        "ema20":           float(close.ewm(span=20, adjust=False).mean().iloc[-1]),
+        "ema200":          float(close.ewm(span=200, adjust=False).mean().iloc[-1]),
+        "rsi":             rsi(close),
+        "atr":             atr(data),
+        "macd":            float((exp1 - exp2).iloc[-1]),
+        "macd_signal":     float((exp1 - exp2).ewm(span=9, adjust=False).mean().iloc[-1]),
+        "vwap":            float((tp * data["Volume"]).cumsum().iloc[-1] / data["Volume"].cumsum().iloc[-1])
+                           if data["Volume"].sum() > 0 else float(tp.iloc[-1]),
+        "volume_trend_up": int(len(data) >= 7 and float(vol3.iloc[-1]) > float(vol3.iloc[-4])),
+        "high_20d":        float(close.iloc[-20:].max()) if len(close) >= 20 else math.nan,
+        "dollar_volume":   price * float(data["Volume"].iloc[-1]),
+        "vol_cv":          float(win.std() / wmean) if len(win) >= 10 and wmean > 0 else math.nan,
+    }
+
+
+def _universe(n_tickers: int = 60, seed: int = 0) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for k in range(n_tickers):
+        n = int(rng.choice([20, 30, 100, 251, 252]))
+        p = 100 * np.cumprod(1 + rng.normal(0, 0.02, n))
+        if k % 7 == 0:
+            p[-15:] = p[-15]          # flat run — RSI loss 0, ATR constant window
+        if k % 11 == 0:
+            p = np.round(p, 1)        # repeated values
+        vol = rng.integers(0, 5_000_000, n).astype(float)
+        if k % 13 == 0:
+            vol[:] = 0                # no volume — VWAP / vol_cv guards
+        if k % 5 == 0:
+            vol[-12:] = 1000          # constant window — zero std
+        idx = pd.bdate_range("2024-01-01", periods=n)
+        frames[f"T{k}"] = pd.DataFrame(
+            {"Open": p * 0.99, "High": p * 1.01, "Low": p * 0.98, "Close": p, "Volume": vol},
+            index=idx,
+        )
+    return frames
+
+
+def _same(a: float, b: float) -> bool:
+    return (math.isnan(a) and math.isnan(b)) or a == b
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")   # reference divides by zero volume
+def test_matches_pandas_reference_exactly():
+    frames = _universe()
+    ind = compute_indicators(frames)
+    assert list(ind.columns) == INDICATOR_COLUMNS
+    assert set(ind.index) == set(frames)
+    for ticker, df in frames.items():
+        for col, expected in _reference(df).items():
+            got = float(ind.at[ticker, col])
+            assert _same(got, float(expected)), (ticker, col, expected, got)
+
+
+def test_multiindex_panel_matches_dict():
+    frames = _universe(8, seed=1)
+    panel = pd.concat(frames, axis=1).swaplevel(axis=1)   # (field, ticker)
+    # Shorter histories become leading NaN rows in the aligned panel
+    from_panel = compute_indicators(panel)
+    from_dict  = compute_indicators(frames)
+    pd.testing.assert_frame_equal(
+        from_panel.sort_index(), from_dict.sort_index(), check_exact=True
+    )
+
+
+def test_short_histories():
+    frames = _universe(3, seed=2)
+    idx = pd.bdate_range("2024-01-01", periods=12)
+    frames["SHORT"] = pd.DataFrame(
+        {"Open": 1.0, "High": 1.1, "Low": 0.9, "Close": np.linspace(1, 2, 12), "Volume": 100.0},
+        index=idx,
+    )
+    frames["ONE"] = frames["SHORT"].iloc[:1]
+    frames["EMPTY"] = pd.DataFrame()
+    ind = compute_indicators(frames)
+    assert "ONE" not in ind.index and "EMPTY" not in ind.index
+    assert math.isnan(ind.at["SHORT", "high_20d"])
+    assert ind.at["SHORT", "vol_cv"] == 0.0   # 11+ bars, constant volume
+    assert ind.at["SHORT", "n_bars"] == 12
+
+
+def test_empty_universe():
+    out = compute_indicators({})
+    assert out.empty and list(out.columns) == INDICATOR_COLUMNS
+
+
+@pytest.mark.parametrize("strategy", ["ai", "crypto"])
+def test_screen_ticker_uses_precomputed_row(strategy):
+    ticker = "T1-USD" if strategy == "crypto" else "T1"
+    df = _universe(3, seed=3)["T1"]
+    precomputed = compute_indicators({ticker: df}).loc[ticker]
+    quote = type("Q", (), {"market_cap": 1e9})()
+    with patch.object(run._provider, "get_quote", return_value=quote):
+        own  = run.screen_ticker(ticker, strategy, data=df)
+        fed  = run.screen_ticker(ticker, strategy, data=df, indicators=precomputed)
+    assert own is not None
+    assert own == fed
@@ -81,6 +81,93 @@ def test_get_ohlcv_range_respects_interval_override(mock_ticker):
     )
 
 
+# ---------------------------------------------------------------------------
+# YFinanceProvider.get_ohlcv_many
+# ---------------------------------------------------------------------------
+
+def _make_download(tickers: list[str]) -> pd.DataFrame:
+    """yf.download(group_by="ticker") shape: (ticker, field) MultiIndex columns."""
+    idx = pd.date_range("2024-01-02", periods=3, freq="D")
+    frames = {}
+    for i, t in enumerate(tickers):
+        frames[t] = pd.DataFrame({
+            "Open":   [100.0 + i] * 3,
+            "High":   [105.0 + i] * 3,
+            "Low":    [99.0 + i] * 3,
+            "Close":  [103.0 + i, float("nan"), 104.0 + i],
+            "Volume": [1_000_000] * 3,
+        }, index=idx)
+    return pd.concat(frames, axis=1)
+
+
+@patch("providers.yfinance_provider.yf.download")
+def test_get_ohlcv_many_splits_batch_per_ticker(mock_download):
+    mock_download.return_value = _make_download(["AAPL", "MSFT"])
+
+    out = YFinanceProvider().get_ohlcv_many(["AAPL", "MSFT"], "1y", "1d")
+
+    mock_download.assert_called_once()
+    _, kwargs = mock_download.call_args
+    assert kwargs["period"] == "1y" and kwargs["group_by"] == "ticker"
+    assert set(out) == {"AAPL", "MSFT"}
+    assert list(out["MSFT"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(out["AAPL"]) == 2                    # NaN-close row dropped
+    assert out["MSFT"]["Close"].iloc[0] == 104.0
+
+
+@patch("providers.yfinance_provider.yf.download")
+def test_get_ohlcv_many_passes_date_range(mock_download):
+    mock_download.return_value = _make_download(["SPY"])
+
+    YFinanceProvider().get_ohlcv_many(["SPY"], start="2024-01-01", end="2024-02-01")
+
+    _, kwargs = mock_download.call_args
+    assert kwargs["start"] == "2024-01-01" and kwargs["end"] == "2024-02-01"
+    assert "period" not in kwargs
+
+
+@patch("providers.yfinance_provider.DOWNLOAD_CHUNK_SIZE", 2)
+@patch("providers.yfinance_provider.yf.download")
+def test_get_ohlcv_many_chunks_requests(mock_download):
+    mock_download.side_effect = lambda chunk, **kw: _make_download(chunk)
+
+    out = YFinanceProvider().get_ohlcv_many(["A", "B", "C", "D", "E"], "1mo", "1d")
+
+    assert mock_download.call_count == 3
+    assert set(out) == {"A", "B", "C", "D", "E"}
+
+
+@patch("providers.yfinance_provider.yf.download")
+def test_get_ohlcv_many_isolates_missing_ticker(mock_download):
+    # Yahoo drops unknown symbols from the batch frame entirely
+    mock_download.return_value = _make_download(["AAPL"])
+
+    out = YFinanceProvider().get_ohlcv_many(["AAPL", "BOGUS"], "1y", "1d")
+
+    assert not out["AAPL"].empty
+    assert out["BOGUS"].empty
+
+
+@patch("providers.yfinance_provider.yf.Ticker")
+@patch("providers.yfinance_provider.yf.download")
+def test_get_ohlcv_many_falls_back_per_ticker_on_batch_error(mock_download, mock_ticker):
+    mock_download.side_effect = Exception("rate limited")
+    good = MagicMock()
+    good.history.return_value = _make_ohlcv()
+
+    def _ticker(symbol):
+        if symbol == "FAIL":
+            raise Exception("no data")
+        return good
+    mock_ticker.side_effect = _ticker
+
+    out = YFinanceProvider().get_ohlcv_many(["SPY", "FAIL"], "20d", "1d")
+
+    good.history.assert_called_once_with(period="20d", interval="1d")
+    assert len(out["SPY"]) == 1
+    assert out["FAIL"].empty
+
+
 # ---------------------------------------------------------------------------
 # YFinanceProvider.get_quote
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""
+tests/test_run_screen.py — Concurrent screening in run.py.
+
+Covers:
+  - screen_all yields results in ticker_map order regardless of completion order
+  - exceptions surface as per-ticker errors, not a crashed run
+  - a hung ticker times out without blocking the rest of the universe
+  - StageTimings accumulates per-stage totals
+
+screen_ticker is patched — no network I/O.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import run
+from run import StageTimings, screen_all
+
+
+def _fake_screen(delays: dict[str, float], fail: set[str] = frozenset()):
+    def _screen(ticker, strategy, *, data=None, indicators=None, timings=None):
+        time.sleep(delays.get(ticker, 0.0))
+        if ticker in fail:
+            raise ValueError(f"boom {ticker}")
+        return {"ticker": ticker, "strategy": strategy}
+    return _screen
+
+
+def test_screen_all_preserves_input_order():
+    # Earlier tickers finish last — output must still follow ticker_map order
+    ticker_map = {"AAA": "ai", "BBB": "tech", "CCC": "momentum", "DDD": "ai"}
+    delays = {"AAA": 0.15, "BBB": 0.10, "CCC": 0.05, "DDD": 0.0}
+    with patch.object(run, "screen_ticker", _fake_screen(delays)):
+        out = list(screen_all(ticker_map, workers=4))
+    assert [t for t, *_ in out] == list(ticker_map)
+    assert [r["strategy"] for _, _, r, _ in out] == list(ticker_map.values())
+
+
+def test_screen_all_matches_serial_results():
+    ticker_map = {f"T{i}": "ai" for i in range(12)}
+    delays = {f"T{i}": 0.01 * (12 - i) for i in range(12)}
+    with patch.object(run, "screen_ticker", _fake_screen(delays, fail={"T3"})):
+        serial   = list(screen_all(ticker_map, workers=1))
+        parallel = list(screen_all(ticker_map, workers=6))
+    assert serial == parallel
+
+
+def test_screen_all_reports_exceptions_per_ticker():
+    ticker_map = {"OK1": "ai", "BAD": "ai", "OK2": "ai"}
+    with patch.object(run, "screen_ticker", _fake_screen({}, fail={"BAD"})):
+        out = {t: (r, e) for t, _, r, e in screen_all(ticker_map, workers=2)}
+    assert out["BAD"] == (None, "boom BAD")
+    assert out["OK1"][1] is None and out["OK2"][1] is None
+
+
+def test_screen_all_times_out_hung_ticker():
+    ticker_map = {"HANG": "ai", "FAST": "ai"}
+    delays = {"HANG": 1.0}
+    t0 = time.monotonic()
+    with patch.object(run, "screen_ticker", _fake_screen(delays)):
+        out = list(screen_all(ticker_map, workers=2, timeout=0.2))
+    assert time.monotonic() - t0 < 0.9
+    assert out[0][0] == "HANG" and out[0][2] is None
+    assert "timed out" in out[0][3]
+    assert out[1][2] == {"ticker": "FAST", "strategy": "ai"}
+
+
+def test_stage_timings_accumulate():
+    timings = StageTimings()
+    for _ in range(3):
+        with timings.stage("ohlcv"):
+            time.sleep(0.01)
+    assert timings.totals["ohlcv"] >= 0.03
+    assert "ohlcv" in timings.summary()
@@ -18,11 +18,13 @@ import pandas as pd
 import streamlit as st
 
 from core.peers import fetch_peer_fundamentals_raw
+from providers.cached_provider import CachedMarketDataProvider
 from providers.yfinance_provider import YFinanceProvider
 
 
-# Singleton provider — stateless wrapper around yfinance; safe at module load.
-_provider = YFinanceProvider()
+# Singleton provider — yfinance behind the on-disk bar store (shared with
+# run.py and the backtest engine); the store opens lazily on first use.
+_provider = CachedMarketDataProvider(YFinanceProvider())
 
 
 # ---------------------------------------------------------------------------
@@ -219,9 +221,10 @@ def fetch_metal_technicals() -> dict:
     """EMA trends, momentum, and signal for each metal future. Includes the
     EMA200 regime modifier so bear-regime moves are flagged."""
     result: dict = {}
+    bars = _provider.get_ohlcv_many(list(METAL_FUTURES.values()), "1y", "1d")
     for name, ticker in METAL_FUTURES.items():
         try:
-            df = _provider.get_ohlcv(ticker, "1y", "1d")
+            df = bars.get(ticker, pd.DataFrame())
             if len(df) < 50:
                 continue
             close = df["Close"]
@@ -279,14 +282,16 @@ def fetch_market_context() -> dict:
     """Derive macro regime signals (SPY / BTC / USD / 10Y) from live price
     data. Used by both Metals and Portfolio tabs."""
     ctx: dict = {}
-    for label, ticker, span in [
-        ("spy",  "SPY",     "3mo"),
-        ("btc",  "BTC-USD", "3mo"),
-        ("usd",  "UUP",     "3mo"),   # USD Bullish ETF proxy for DXY
-        ("tnx",  "^TNX",    "3mo"),   # 10-year yield
-    ]:
+    symbols = [
+        ("spy",  "SPY"),
+        ("btc",  "BTC-USD"),
+        ("usd",  "UUP"),   # USD Bullish ETF proxy for DXY
+        ("tnx",  "^TNX"),  # 10-year yield
+    ]
+    bars = _provider.get_ohlcv_many([t for _, t in symbols], "3mo", "1d")
+    for label, ticker in symbols:
         try:
-            df    = _provider.get_ohlcv(ticker, span, "1d")
+            df    = bars[ticker]
             close = df["Close"]
             price = float(close.iloc[-1])
             ema20 = float(close.ewm(span=20, adjust=False).mean().iloc[-1])